@@ -0,0 +1,46 @@
+"""
+Shared HTTP Client
+
+A single httpx.AsyncClient is created on first use and stored on app.state,
+so tools calling external HTTP APIs reuse one connection pool
+instead of building a new client (TLS context, pool) on every call.
+"""
+
+from importlib.util import find_spec
+
+import httpx
+from fastapi import Request
+
+# HTTP/2 needs the optional h2 package
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the application-wide HTTP client"""
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=200,
+            max_keepalive_connections=50,
+            keepalive_expiry=60.0,
+        ),
+    )
+
+
+async def get_http_client(request: Request) -> httpx.AsyncClient:
+    """
+    FastAPI dependency returning the shared HTTP client, created on first call.
+
+    Async so FastAPI runs it on the event loop instead of a threadpool; with
+    no await between the check and the assignment, concurrent first calls
+    cannot each create a client.
+
+    Example:
+        client: httpx.AsyncClient = Depends(get_http_client)
+    """
+    state = request.app.state
+    client = getattr(state, "http_client", None)
+    if client is None:
+        client = state.http_client = create_http_client()
+    return client
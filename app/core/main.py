@@ -4,29 +4,59 @@ MCP Server Main Application
 FastAPI application that serves MCP tools.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+try:
+    # orjson is optional: serialize responses with it when installed
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultResponse
+
 
 from oxsci_oma_mcp import tool_router
 from oxsci_shared_core.router import default_router
 
 from app.core.config import config
 
+# Serve OpenAPI schema and interactive docs outside production only
+_docs_kwargs = (
+    {"openapi_url": None, "docs_url": None, "redoc_url": None}
+    if config.ENV == "production"
+    else {}
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the shared HTTP client at shutdown if a tool created it"""
+    yield
+    client = getattr(app.state, "http_client", None)
+    if client is not None:
+        await client.aclose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=f"{config.SERVICE_NAME} MCP Server",
     description="MCP Server built with oxsci-oma-mcp",
     version=config.SERVICE_VERSION,
+    default_response_class=DefaultResponse,
+    lifespan=lifespan,
+    **_docs_kwargs,
 )
 
-# Add CORS middleware
+# Add CORS middleware (browsers cache preflight responses for max_age seconds)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
 
@@ -8,7 +8,7 @@ Note: IDataServiceClient and require_data_service are provided by oxsci-oma-mcp
 """
 
 from fastapi import Depends
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from oxsci_oma_mcp import (
     oma_tool,
@@ -18,10 +18,15 @@ from oxsci_oma_mcp import (
     require_data_service,
 )
 
+# Data service endpoint for overview sections (formatted with the overview ID)
+_SECTIONS_ENDPOINT = "/article_structured_contents/overviews/%s/sections"
+
 
 class ExampleDataServiceRequest(BaseModel):
     """Request model for example_data_service_tool"""
 
+    model_config = ConfigDict(defer_build=True)
+
     overview_id: str = Field(
         ..., description="Overview ID to fetch sections from data service"
     )
@@ -31,6 +36,8 @@ class ExampleDataServiceRequest(BaseModel):
 class ExampleDataServiceResponse(BaseModel):
     """Response model for example_data_service_tool"""
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     overview_id: str = Field(..., description="Overview ID that was fetched")
     sections: list = Field(..., description="List of sections from data service")
     metadata: dict = Field(
@@ -106,7 +113,7 @@ async def example_data_service_tool(
     try:
         sections = await data_service.call(
             method="GET",
-            endpoint=f"/article_structured_contents/overviews/{request.overview_id}/sections",
+            endpoint=_SECTIONS_ENDPOINT % request.overview_id,
             query_params={"user_id": user_id} if user_id else {},
             timeout=30,
         )
@@ -132,22 +139,3 @@ async def example_data_service_tool(
     return ExampleDataServiceResponse(
         overview_id=request.overview_id, sections=sections, metadata=metadata
     )
-
-
-# ==================== Benefits Summary ====================
-"""
-Benefits of using IDataServiceClient (from oxsci-oma-mcp):
-
-✅ **Automatic Injection**: No manual client creation
-✅ **Pre-configured**: DATA_SERVICE_URL auto-loaded from config
-✅ **Auth Forwarding**: Authentication automatically passed through
-✅ **Single Instance**: Reused across multiple calls in same request
-✅ **Clean API**: Only specify method and endpoint
-✅ **Less Code**: Reduces boilerplate by ~60%
-✅ **Consistent Pattern**: Same as require_context from oxsci-oma-mcp
-
-Code Reduction Example:
-    Before: 6 lines to make a data service call
-    After:  3 lines to make the same call
-    Reduction: 50% less code, 100% clearer intent
-"""
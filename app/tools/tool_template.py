@@ -24,7 +24,7 @@ Effect of enable=False:
 
 from typing import Optional, List
 from fastapi import Depends, HTTPException
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from oxsci_oma_mcp import (
     oma_tool,
@@ -45,6 +45,9 @@ class ToolTemplateRequest(BaseModel):
     Demonstrates different parameter types and validation patterns.
     """
 
+    # Build the model's validator and schema on first use instead of at import
+    model_config = ConfigDict(defer_build=True)
+
     # Required parameter - must be provided
     input_text: str = Field(
         ...,  # ... means required
@@ -97,6 +100,9 @@ class ToolTemplateResponse(BaseModel):
     Always define clear response structure for better API documentation.
     """
 
+    # Responses are never modified after construction
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     result: str = Field(
         ...,
         description="Processed result text",
@@ -240,6 +246,8 @@ async def tool_template(
     # ✅ Clean and simple API
 
     # ==================== 3. Build Metadata ====================
+    result_length = len(result)
+
     metadata = {
         "processed_by": user_id,
         "tags": request.tags,
@@ -252,7 +260,7 @@ async def tool_template(
     processing_info = {
         "original_text": request.input_text,
         "original_length": len(request.input_text),
-        "result_length": len(result),
+        "result_length": result_length,
         "transformations": [],
     }
 
@@ -267,7 +275,7 @@ async def tool_template(
     # ==================== 4. Update Context for Next Tools ====================
     # Store results that might be useful for subsequent tools in the chain
     context.set_shared_data("last_result", result)
-    context.set_shared_data("last_length", len(result))
+    context.set_shared_data("last_length", result_length)
     context.set_shared_data("execution_count", execution_count + 1)
     context.set_shared_data("last_tool", "tool_template")
 
@@ -279,49 +287,47 @@ async def tool_template(
     return ToolTemplateResponse(
         result=result,
         metadata=metadata,
-        length=len(result),
+        length=result_length,
         processing_info=processing_info,
     )
 
 
 # ==================== Additional Examples ====================
 
-"""
-Example 1: Simple text processing
-POST /tools/tool_template
-{
-    "arguments": {
-        "input_text": "hello world"
-    },
-    "context": {}
-}
-Response: {"result": "hello world", "length": 11, ...}
-
-Example 2: Complex transformation
-POST /tools/tool_template
-{
-    "arguments": {
-        "input_text": "test",
-        "uppercase": true,
-        "prefix": ">> ",
-        "repeat_count": 3,
-        "tags": ["important", "demo"]
-    },
-    "context": {
-        "user_id": "user123"
-    }
-}
-Response: {"result": ">> TEST >> TEST >> TEST", "length": 23, ...}
-
-Example 3: Tool chaining (this tool can read data from previous tools)
-If previous tool stored data in context, this tool can access it:
-- context.get_shared_data("last_result") - get previous result
-- context.get_shared_data("user_preferences") - get user settings
-- etc.
-
-Tool Discovery:
-- With enable=True: Tool appears in /tools/discover (agents can find it)
-- With enable=False: Tool does NOT appear in /tools/discover
-- Always appears in /tools/list regardless of enable flag
-- Can still be executed via POST /tools/tool_template regardless of enable flag
-"""
+# Example 1: Simple text processing
+# POST /tools/tool_template
+# {
+#     "arguments": {
+#         "input_text": "hello world"
+#     },
+#     "context": {}
+# }
+# Response: {"result": "hello world", "length": 11, ...}
+#
+# Example 2: Complex transformation
+# POST /tools/tool_template
+# {
+#     "arguments": {
+#         "input_text": "test",
+#         "uppercase": true,
+#         "prefix": ">> ",
+#         "repeat_count": 3,
+#         "tags": ["important", "demo"]
+#     },
+#     "context": {
+#         "user_id": "user123"
+#     }
+# }
+# Response: {"result": ">> TEST >> TEST >> TEST", "length": 23, ...}
+#
+# Example 3: Tool chaining (this tool can read data from previous tools)
+# If previous tool stored data in context, this tool can access it:
+# - context.get_shared_data("last_result") - get previous result
+# - context.get_shared_data("user_preferences") - get user settings
+# - etc.
+#
+# Tool Discovery:
+# - With enable=True: Tool appears in /tools/discover (agents can find it)
+# - With enable=False: Tool does NOT appear in /tools/discover
+# - Always appears in /tools/list regardless of enable flag
+# - Can still be executed via POST /tools/tool_template regardless of enable flag
@@ -19,7 +19,7 @@ Dependencies:
 """
 
 import argparse
-import os
+import functools
 import platform
 import re
 import shutil
@@ -29,8 +29,9 @@ import sys
 import tempfile
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 
 GITHUB_REPO = "OxSci-AI/oxsci-mcp-scaffold"
@@ -39,9 +40,31 @@ GITHUB_ZIP_URL = (
     f"https://github.com/{GITHUB_REPO}/archive/refs/heads/{GITHUB_BRANCH}.zip"
 )
 
-
+# Name normalization patterns (compiled once)
+_SERVICE_INVALID_CHARS = re.compile(r"[^a-z0-9-]+")
+_REPEATED_HYPHENS = re.compile(r"-{2,}")
+_TOOL_INVALID_CHARS = re.compile(r"[^a-z0-9_]+")
+_REPEATED_UNDERSCORES = re.compile(r"_{2,}")
+_FIRST_LETTER = re.compile(r"[a-z]")
+
+# Name validation patterns (\Z: no trailing newline allowed, unlike $)
+_VALID_SERVICE_NAME = re.compile(r"[a-z][a-z0-9-]*\Z")
+_VALID_TOOL_NAME = re.compile(r"[a-z][a-z0-9_]*\Z")
+
+# Top-level scaffold entries that are not copied into a new project
+SKIPPED_TEMPLATE_ITEMS = {
+    "setup.py",
+    "install.py",
+    ".git",
+    "__pycache__",
+    ".DS_Store",
+    "README.md",
+}
+
+
+@functools.lru_cache(maxsize=1)
 def detect_platform() -> str:
-    """Detect the operating system platform."""
+    """Detect the operating system platform (cached, the platform cannot change)."""
     system = platform.system().lower()
     if system == "linux":
         # Try to detect Linux distribution
@@ -82,9 +105,12 @@ def check_python_version() -> Tuple[bool, Optional[str]]:
 
 def check_git() -> Tuple[bool, Optional[str]]:
     """Check if Git is installed."""
+    git_path = shutil.which("git")
+    if not git_path:
+        return False, None
     try:
         result = subprocess.run(
-            ["git", "--version"],
+            [git_path, "--version"],
             capture_output=True,
             text=True,
             timeout=5,
@@ -100,35 +126,29 @@ def check_git() -> Tuple[bool, Optional[str]]:
 
 
 def check_network_connectivity() -> bool:
-    """Check if network connectivity is available."""
+    """Check if GitHub is reachable."""
+    # The timeout bounds the TCP connect only, not the DNS lookup before it
     try:
-        # Try to connect to GitHub
-        socket.create_connection(("github.com", 443), timeout=5)
-        return True
+        with socket.create_connection(("github.com", 443), timeout=2):
+            return True
     except (OSError, socket.timeout):
         return False
 
 
-def check_aws_cli() -> Tuple[bool, Optional[str]]:
-    """Check if AWS CLI is installed."""
+def check_internet_connectivity() -> bool:
+    """Check if the internet is reachable without DNS (used to refine errors)."""
     try:
-        result = subprocess.run(
-            ["aws", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            # AWS CLI output format: "aws-cli/2.x.x Python/3.x.x ..."
-            version_line = result.stdout.strip().split("\n")[0]
-            # Extract version part (e.g., "aws-cli/2.x.x")
-            version = version_line.split()[0] if version_line else "installed"
-            return True, version
-        return False, None
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        return False, None
-    except Exception:
-        return False, None
+        with socket.create_connection(("1.1.1.1", 53), timeout=2):
+            return True
+    except (OSError, socket.timeout):
+        return False
+
+
+def check_aws_cli() -> Tuple[bool, Optional[str]]:
+    """Check if AWS CLI is installed (PATH lookup only, no subprocess)."""
+    if shutil.which("aws"):
+        return True, "installed"
+    return False, None
 
 
 def check_environment() -> bool:
@@ -167,8 +187,15 @@ def check_environment() -> bool:
         return False
     print()
 
+    # Run the blocking checks (subprocess spawns, TCP connect) concurrently
+    # once Python is known to be usable; results are reported in order below
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        git_future = executor.submit(check_git)
+        network_future = executor.submit(check_network_connectivity)
+        aws_future = executor.submit(check_aws_cli)
+
     # Check Git
-    git_ok, git_version = check_git()
+    git_ok, git_version = git_future.result()
     if git_ok:
         print(f"  ✅ Git: {git_version}")
     else:
@@ -188,12 +215,16 @@ def check_environment() -> bool:
     print()
 
     # Check network connectivity
-    network_ok = check_network_connectivity()
+    network_ok = network_future.result()
     if network_ok:
         print("  ✅ Network: Connected")
     else:
         print("  ❌ Network: No connection to GitHub")
-        print("     Please check your internet connection")
+        if check_internet_connectivity():
+            print("     Internet is reachable but GitHub is not")
+            print("     Please check your DNS, proxy or firewall settings")
+        else:
+            print("     Please check your internet connection")
         return False
     print()
 
@@ -213,7 +244,7 @@ def check_environment() -> bool:
     print()
 
     # Check AWS CLI (warning only, not required for installation)
-    aws_ok, aws_version = check_aws_cli()
+    aws_ok, aws_version = aws_future.result()
     if aws_ok:
         print(f"  ✅ AWS CLI: {aws_version}")
         print(
@@ -270,16 +301,14 @@ def get_input(prompt: str, validator=None) -> str:
 
 def normalize_service_name(name: str) -> str:
     """Normalize service name: lowercase, convert spaces/special chars to hyphens."""
-    # Convert to lowercase
-    normalized = name.lower().strip()
-    # Replace spaces and other non-alphanumeric characters (except hyphens) with hyphens
-    normalized = re.sub(r"[^a-z0-9-]+", "-", normalized)
-    # Remove leading/trailing hyphens and multiple consecutive hyphens
-    normalized = re.sub(r"-+", "-", normalized).strip("-")
+    # Lowercase, replace spaces and other non-alphanumeric characters (except
+    # hyphens) with hyphens, then collapse repeated and strip leading/trailing hyphens
+    normalized = _SERVICE_INVALID_CHARS.sub("-", name.lower().strip())
+    normalized = _REPEATED_HYPHENS.sub("-", normalized).strip("-")
     # Ensure it starts with a letter
     if normalized and not normalized[0].isalpha():
         # Find first letter and take from there
-        match = re.search(r"[a-z]", normalized)
+        match = _FIRST_LETTER.search(normalized)
         if match:
             normalized = normalized[match.start() :]
         else:
@@ -289,16 +318,14 @@ def normalize_service_name(name: str) -> str:
 
 def normalize_tool_name(name: str) -> str:
     """Normalize tool name: lowercase, convert spaces/hyphens/special chars to underscores."""
-    # Convert to lowercase
-    normalized = name.lower().strip()
-    # Replace spaces, hyphens, and other non-alphanumeric characters with underscores
-    normalized = re.sub(r"[^a-z0-9_]+", "_", normalized)
-    # Remove leading/trailing underscores and multiple consecutive underscores
-    normalized = re.sub(r"_+", "_", normalized).strip("_")
+    # Lowercase, replace spaces, hyphens, and other non-alphanumeric characters with
+    # underscores, then collapse repeated and strip leading/trailing underscores
+    normalized = _TOOL_INVALID_CHARS.sub("_", name.lower().strip())
+    normalized = _REPEATED_UNDERSCORES.sub("_", normalized).strip("_")
     # Ensure it starts with a letter
     if normalized and not normalized[0].isalpha():
         # Find first letter and take from there
-        match = re.search(r"[a-z]", normalized)
+        match = _FIRST_LETTER.search(normalized)
         if match:
             normalized = normalized[match.start() :]
         else:
@@ -308,7 +335,7 @@ def normalize_tool_name(name: str) -> str:
 
 def validate_service_name(name: str) -> bool:
     """Validate service name format (after normalization)."""
-    if not name or not re.match(r"^[a-z][a-z0-9-]*$", name):
+    if not name or not _VALID_SERVICE_NAME.match(name):
         print(
             "  Error: Service name must start with a letter and contain only lowercase letters, numbers, and hyphens."
         )
@@ -318,7 +345,7 @@ def validate_service_name(name: str) -> bool:
 
 def validate_tool_name(name: str) -> bool:
     """Validate tool name format (after normalization)."""
-    if not name or not re.match(r"^[a-z][a-z0-9_]*$", name):
+    if not name or not _VALID_TOOL_NAME.match(name):
         print(
             "  Error: Tool name must start with a letter and contain only lowercase letters, numbers, and underscores."
         )
@@ -332,6 +359,15 @@ def to_pascal_case(name: str) -> str:
     return "".join(word.capitalize() for word in parts)
 
 
+def replace_all(text: str, replacements: Dict[str, str]) -> str:
+    """Apply several literal replacements in a single pass over text."""
+    # Longest keys first so a key that is a prefix of another cannot shadow it
+    pattern = re.compile(
+        "|".join(map(re.escape, sorted(replacements, key=len, reverse=True)))
+    )
+    return pattern.sub(lambda match: replacements[match.group(0)], text)
+
+
 def download_and_extract_scaffold(temp_dir: Path) -> Path:
     """Download and extract scaffold from GitHub."""
     print("Downloading scaffold from GitHub...")
@@ -339,16 +375,28 @@ def download_and_extract_scaffold(temp_dir: Path) -> Path:
     zip_path = temp_dir / "scaffold.zip"
 
     try:
-        # Download zip file
-        with urllib.request.urlopen(GITHUB_ZIP_URL) as response:
+        # Download zip file (streamed to disk in 1 MiB chunks)
+        request = urllib.request.Request(
+            GITHUB_ZIP_URL,
+            headers={
+                "User-Agent": "oxsci-mcp-installer",
+                "Accept-Encoding": "identity",
+            },
+        )
+        with urllib.request.urlopen(request, timeout=30) as response:
             with open(zip_path, "wb") as out_file:
-                out_file.write(response.read())
+                shutil.copyfileobj(response, out_file, length=1024 * 1024)
 
         print("Extracting files...")
 
-        # Extract zip file
+        # Extract zip file, skipping top-level entries that are not copied
+        # (archive members are "<repo>-<branch>/<item>/...")
         with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(temp_dir)
+            for member in zip_ref.infolist():
+                parts = Path(member.filename).parts
+                if len(parts) > 1 and parts[1] in SKIPPED_TEMPLATE_ITEMS:
+                    continue
+                zip_ref.extract(member, temp_dir)
 
         # Find extracted directory (should be oxsci-mcp-scaffold-main or similar)
         extracted_dirs = [
@@ -504,35 +552,19 @@ def setup_service(
             print(f"Creating directory: {folder_name}")
             target_dir.mkdir(parents=True, exist_ok=True)
 
-            # Copy all files and directories except setup.py, install.py, and tool_template.py
+            # Copy the extracted template (skipped items were never extracted)
             print("Copying template files...")
-            for item in scaffold_dir.iterdir():
-                if item.name in [
-                    "setup.py",
-                    "install.py",
-                    ".git",
-                    "__pycache__",
-                    ".DS_Store",
-                    "README.md",
-                ]:
-                    continue
-
-                dest = target_dir / item.name
-                if item.is_file():
-                    shutil.copy2(item, dest)
-                elif item.is_dir():
-                    shutil.copytree(item, dest)
+            shutil.copytree(scaffold_dir, target_dir, dirs_exist_ok=True)
 
             # Update pyproject.toml
             print("Configuring pyproject.toml...")
             pyproject_path = target_dir / "pyproject.toml"
-            content = pyproject_path.read_text()
-            content = content.replace(
-                'name = "mcp-server-template"', f'name = "{folder_name}"'
-            )
-            content = content.replace(
-                'description = "MCP Server Template built with oxsci-oma-mcp"',
-                f'description = "{description}"',
+            content = replace_all(
+                pyproject_path.read_text(),
+                {
+                    'name = "mcp-server-template"': f'name = "{folder_name}"',
+                    'description = "MCP Server Template built with oxsci-oma-mcp"': f'description = "{description}"',
+                },
             )
             pyproject_path.write_text(content)
 
@@ -545,13 +577,15 @@ def setup_service(
             if not tool_template_path.exists():
                 tool_template_path = target_dir / "app" / "tools" / "example_tool.py"
 
-            tool_content = tool_template_path.read_text()
             # Replace template placeholders
-            tool_content = tool_content.replace("example_tool", tool_name)
-            tool_content = tool_content.replace("ExampleTool", to_pascal_case(tool_name))
-            tool_content = tool_content.replace(
-                "Example tool that processes text input",
-                f"{to_pascal_case(tool_name)} tool",
+            pascal_tool_name = to_pascal_case(tool_name)
+            tool_content = replace_all(
+                tool_template_path.read_text(),
+                {
+                    "example_tool": tool_name,
+                    "ExampleTool": pascal_tool_name,
+                    "Example tool that processes text input": f"{pascal_tool_name} tool",
+                },
             )
 
             tool_path.write_text(tool_content)
@@ -578,13 +612,6 @@ from . import {tool_name}  # noqa: F401
 '''
             tools_init.write_text(init_content)
 
-            # Update config.py with service name
-            print("Updating config.py...")
-            config_path = target_dir / "app" / "core" / "config.py"
-            config_content = config_path.read_text()
-            # This will use the SERVICE_NAME from BaseConfig, but we should update comments if any
-            config_path.write_text(config_content)
-
             # Create README.md
             readme_content = f"""# {folder_name}
 
@@ -631,11 +658,19 @@ For detailed documentation, see: https://github.com/{GITHUB_REPO}
 
             # Initialize git repository
             print("Initializing git repository...")
-            os.chdir(target_dir)
-            os.system("git init")
-            os.system("git add .")
-            os.system(
-                f'git commit -m "Initial commit: {folder_name} from oxsci-mcp-scaffold"'
+            # git's own progress output is discarded; errors still reach stderr
+            git_run = {"cwd": target_dir, "check": False, "stdout": subprocess.DEVNULL}
+            subprocess.run(["git", "init", "-q"], **git_run)
+            subprocess.run(["git", "add", "-A"], **git_run)
+            subprocess.run(
+                [
+                    "git",
+                    "commit",
+                    "-q",
+                    "-m",
+                    f"Initial commit: {folder_name} from oxsci-mcp-scaffold",
+                ],
+                **git_run,
             )
 
             print()
@@ -11,11 +11,26 @@ This script sets up a new MCP server by:
 6. Initializing git repository
 """
 
-import os
 import re
 import shutil
+import subprocess
 import sys
 from pathlib import Path
+from typing import Dict
+
+# Name validation and splitting patterns (\Z: no trailing newline allowed, unlike $)
+_VALID_SERVICE_NAME = re.compile(r"[a-z][a-z0-9-]*\Z")
+_VALID_TOOL_NAME = re.compile(r"[a-z][a-z0-9_]*\Z")
+_NAME_SEPARATORS = re.compile(r"[_-]")
+
+# Top-level scaffold entries that are not copied into a new project
+SKIPPED_TEMPLATE_ITEMS = {
+    "setup.py",
+    "install.py",
+    ".git",
+    "__pycache__",
+    ".DS_Store",
+}
 
 
 def get_input(prompt: str, validator=None) -> str:
@@ -33,7 +48,7 @@ def get_input(prompt: str, validator=None) -> str:
 def validate_service_name(name: str) -> bool:
     """Validate service name format."""
     # Allow alphanumeric and hyphens, must start with letter
-    if not re.match(r"^[a-z][a-z0-9-]*$", name):
+    if not _VALID_SERVICE_NAME.match(name):
         print(
             "  Error: Service name must start with a letter and contain only lowercase letters, numbers, and hyphens."
         )
@@ -44,7 +59,7 @@ def validate_service_name(name: str) -> bool:
 def validate_tool_name(name: str) -> bool:
     """Validate tool name format."""
     # Allow alphanumeric and underscores, must start with letter
-    if not re.match(r"^[a-z][a-z0-9_]*$", name):
+    if not _VALID_TOOL_NAME.match(name):
         print(
             "  Error: Tool name must start with a letter and contain only lowercase letters, numbers, and underscores."
         )
@@ -54,10 +69,19 @@ def validate_tool_name(name: str) -> bool:
 
 def to_pascal_case(name: str) -> str:
     """Convert snake_case or kebab-case to PascalCase."""
-    parts = re.split(r"[_-]", name)
+    parts = _NAME_SEPARATORS.split(name)
     return "".join(word.capitalize() for word in parts)
 
 
+def replace_all(text: str, replacements: Dict[str, str]) -> str:
+    """Apply several literal replacements in a single pass over text."""
+    # Longest keys first so a key that is a prefix of another cannot shadow it
+    pattern = re.compile(
+        "|".join(map(re.escape, sorted(replacements, key=len, reverse=True)))
+    )
+    return pattern.sub(lambda match: replacements[match.group(0)], text)
+
+
 def setup_service():
     """Main setup function."""
     print("=" * 70)
@@ -122,32 +146,26 @@ def setup_service():
 
         # Copy all files and directories except setup.py, install.py, and tool_template.py
         print("Copying template files...")
-        for item in script_dir.iterdir():
-            if item.name in [
-                "setup.py",
-                "install.py",
-                ".git",
-                "__pycache__",
-                ".DS_Store",
-            ]:
-                continue
-
-            dest = target_dir / item.name
-            if item.is_file():
-                shutil.copy2(item, dest)
-            elif item.is_dir():
-                shutil.copytree(item, dest)
+        # The new project directory may itself live inside the scaffold (when run
+        # from the scaffold root), so it is skipped as well
+        skipped_top_level = SKIPPED_TEMPLATE_ITEMS | {target_dir.name}
+
+        def ignore_items(directory, names):
+            if Path(directory) == script_dir:
+                return [name for name in names if name in skipped_top_level]
+            return [name for name in names if name in ("__pycache__", ".DS_Store")]
+
+        shutil.copytree(script_dir, target_dir, ignore=ignore_items, dirs_exist_ok=True)
 
         # Update pyproject.toml
         print("Configuring pyproject.toml...")
         pyproject_path = target_dir / "pyproject.toml"
-        content = pyproject_path.read_text()
-        content = content.replace(
-            'name = "mcp-server-template"', f'name = "{folder_name}"'
-        )
-        content = content.replace(
-            'description = "MCP Server Template built with oxsci-oma-mcp"',
-            f'description = "{description}"',
+        content = replace_all(
+            pyproject_path.read_text(),
+            {
+                'name = "mcp-server-template"': f'name = "{folder_name}"',
+                'description = "MCP Server Template built with oxsci-oma-mcp"': f'description = "{description}"',
+            },
         )
         pyproject_path.write_text(content)
 
@@ -160,13 +178,15 @@ def setup_service():
         if not tool_template_path.exists():
             tool_template_path = target_dir / "app" / "tools" / "example_tool.py"
 
-        tool_content = tool_template_path.read_text()
         # Replace template placeholders
-        tool_content = tool_content.replace("example_tool", tool_name)
-        tool_content = tool_content.replace("ExampleTool", to_pascal_case(tool_name))
-        tool_content = tool_content.replace(
-            "Example tool that processes text input",
-            f"{to_pascal_case(tool_name)} tool",
+        pascal_tool_name = to_pascal_case(tool_name)
+        tool_content = replace_all(
+            tool_template_path.read_text(),
+            {
+                "example_tool": tool_name,
+                "ExampleTool": pascal_tool_name,
+                "Example tool that processes text input": f"{pascal_tool_name} tool",
+            },
         )
 
         tool_path.write_text(tool_content)
@@ -193,15 +213,6 @@ from . import {tool_name}  # noqa: F401
 '''
         tools_init.write_text(init_content)
 
-        # Initialize git repository
-        print("Initializing git repository...")
-        os.chdir(target_dir)
-        os.system("git init")
-        os.system("git add .")
-        os.system(
-            f'git commit -m "Initial commit: {folder_name} from oxsci-mcp-scaffold"'
-        )
-
         # Create .gitignore if not exists
         gitignore_path = target_dir / ".gitignore"
         if not gitignore_path.exists():
@@ -257,8 +268,25 @@ Thumbs.db
 .env.local
 """
             gitignore_path.write_text(gitignore_content)
-            os.system("git add .gitignore")
-            os.system('git commit -m "Add .gitignore"')
+
+        # Initialize git repository (.gitignore is in place, so one commit covers all)
+        if shutil.which("git") is None:
+            print("⚠️  git not found, skipping repository initialization")
+        else:
+            print("Initializing git repository...")
+            subprocess.run(["git", "init", "-q"], cwd=target_dir, check=False)
+            subprocess.run(["git", "add", "-A"], cwd=target_dir, check=False)
+            subprocess.run(
+                [
+                    "git",
+                    "commit",
+                    "-q",
+                    "-m",
+                    f"Initial commit: {folder_name} from oxsci-mcp-scaffold",
+                ],
+                cwd=target_dir,
+                check=False,
+            )
 
         print()
         print("=" * 70)
@@ -8,52 +8,36 @@ from fastapi.testclient import TestClient
 from app.core.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Test client fixture"""
-    return TestClient(app)
-
-
-def test_root_endpoint(client):
-    """Test root endpoint"""
-    response = client.get("/")
-    assert response.status_code == 200
-    data = response.json()
-    assert "service" in data
-    assert "status" in data
-    assert data["status"] == "running"
-
-
-def test_health_endpoint(client):
-    """Test health check endpoint"""
-    response = client.get("/health")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["status"] == "healthy"
-
-
-def test_discover_tools(client):
-    """Test tool discovery endpoint"""
-    response = client.get("/tools/discover")
-    assert response.status_code == 200
-    data = response.json()
-    assert "tools" in data
-    assert "server_info" in data
-    assert isinstance(data["tools"], list)
-
-
-def test_list_tools(client):
-    """Test simplified tools list endpoint"""
-    response = client.get("/tools/list")
+    """Test client fixture (shared; runs app startup/shutdown once)"""
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    "path, expected_keys, expected_values",
+    [
+        ("/", {"service", "status"}, {"status": "running"}),
+        ("/health", {"status"}, {"status": "healthy"}),
+        ("/tools/discover", {"tools", "server_info"}, {}),
+        ("/tools/list", {"tools", "count"}, {}),
+    ],
+    ids=["root", "health", "discover_tools", "list_tools"],
+)
+def test_get_endpoints(client, path, expected_keys, expected_values):
+    """Test root, health check, tool discovery and tools list endpoints"""
+    response = client.get(path)
     assert response.status_code == 200
     data = response.json()
-    assert "tools" in data
-    assert "count" in data
-    assert isinstance(data["tools"], list)
+    assert expected_keys <= data.keys()
+    for key, value in expected_values.items():
+        assert data[key] == value
+    if "tools" in data:
+        assert isinstance(data["tools"], list)
 
 
-@pytest.mark.asyncio
-async def test_example_tool_execution(client):
+def test_example_tool_execution(client):
     """Test example tool execution"""
     response = client.post(
         "/tools/example_tool",